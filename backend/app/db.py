@@ -2,17 +2,49 @@
 from __future__ import annotations
 
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./app.db")
+# Set INIT_DB=0 where migrations own the schema to skip create_all on every boot.
+INIT_DB = os.getenv("INIT_DB", "1").strip().lower() not in {"0", "false", "no", "off"}
 
 connect_args = {}
+engine_kwargs = {"future": True}
+sqlite_file = False
 if DATABASE_URL.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
+    sqlite_file = make_url(DATABASE_URL).database not in (None, "", ":memory:")
+    if not sqlite_file:
+        # Every new connection to an in-memory database starts empty, so share one.
+        engine_kwargs["poolclass"] = StaticPool
+else:
+    engine_kwargs.update(
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        # Reuse the most recently returned connection so idle overflow connections age out.
+        pool_use_lifo=True,
+    )
+
+engine = create_engine(DATABASE_URL, connect_args=connect_args, **engine_kwargs)
+
+if sqlite_file:
+
+    @event.listens_for(engine, "connect")
+    def _tune_sqlite(dbapi_connection, connection_record):
+        """Use WAL so readers never block the writer and commits skip a full fsync."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
 
-engine = create_engine(DATABASE_URL, connect_args=connect_args, future=True)
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
@@ -21,6 +53,46 @@ class Base(DeclarativeBase):
     """Declarative base class for SQLAlchemy models."""
 
 
+_schema_ready = False
+
+# create_all() only builds indexes for tables it creates, so databases made before
+# observations got its (episode_id, date) index are brought up to date here.
+_INDEX_MIGRATIONS = (
+    "CREATE INDEX IF NOT EXISTS ix_observations_episode_id_date ON observations (episode_id, date)",
+    "DROP INDEX IF EXISTS ix_observations_episode_id",
+)
+
+
+def init_db() -> None:
+    """Create any missing tables and indexes once per process."""
+    global _schema_ready
+    if _schema_ready:
+        return
+    from . import models  # noqa: F401  # register tables on Base.metadata
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        for statement in _INDEX_MIGRATIONS:
+            connection.execute(text(statement))
+    _schema_ready = True
+
+
+def warm_pool() -> None:
+    """Open the pool's steady-state connections up front so early requests skip the handshake."""
+    size = getattr(engine.pool, "size", None)
+    if size is None or DATABASE_URL.startswith("sqlite"):
+        return
+    connections = []
+    try:
+        for _ in range(size()):
+            connection = engine.connect()
+            connections.append(connection)
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            connection.close()
+
+
 def get_db():
     """Provide a transactional scope around a series of operations."""
     db = SessionLocal()
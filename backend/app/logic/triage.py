@@ -1,8 +1,20 @@
 """Triage business logic."""
 from __future__ import annotations
 
+import re
 from typing import Dict, List, Tuple
 
+_SELF_HARM_ACTIONS = (
+    "โทรหาสายด่วนสุขภาพจิต 1323 หรือพบแพทย์ทันที",
+    "อย่าอยู่ลำพัง ขอความช่วยเหลือจากคนใกล้ชิด",
+)
+_BP_CRISIS_ACTIONS = (
+    "ไปห้องฉุกเฉินทันที",
+    "หลีกเลี่ยงการขับรถเอง",
+)
+_DIZZY_RE = re.compile(r"เวียน|หน้ามืด", re.IGNORECASE)
+_EMPTY_ANSWERS: Dict[str, bool] = {}
+
 
 def triage_level_from_inputs(payload: Dict) -> Tuple[str, List[str], str]:
     """Return triage level, actions, and rationale based on payload."""
@@ -13,22 +25,16 @@ def triage_level_from_inputs(payload: Dict) -> Tuple[str, List[str], str]:
     bp_sys = payload.get("bp_sys")
     bp_dia = payload.get("bp_dia")
     glucose = payload.get("glucose")
-    self_harm = payload.get("self_harm") or payload.get("red_flag_answers", {}).get("self_harm")
+    self_harm = payload.get("self_harm") or (payload.get("red_flag_answers") or _EMPTY_ANSWERS).get("self_harm")
 
     if self_harm:
         triage_level = "แดง"
-        actions.extend([
-            "โทรหาสายด่วนสุขภาพจิต 1323 หรือพบแพทย์ทันที",
-            "อย่าอยู่ลำพัง ขอความช่วยเหลือจากคนใกล้ชิด",
-        ])
+        actions.extend(_SELF_HARM_ACTIONS)
         rationale_parts.append("มีความเสี่ยงทำร้ายตนเอง")
 
     if bp_sys is not None and bp_dia is not None and bp_sys >= 180 and bp_dia >= 120:
         triage_level = "แดง"
-        actions.extend([
-            "ไปห้องฉุกเฉินทันที",
-            "หลีกเลี่ยงการขับรถเอง",
-        ])
+        actions.extend(_BP_CRISIS_ACTIONS)
         rationale_parts.append("ความดันโลหิตเข้าเกณฑ์วิกฤต")
 
     if glucose is not None and glucose >= 300:
@@ -58,21 +64,26 @@ def mock_condition_hints(payload: Dict) -> List[str]:
     """Provide a naive list of possible conditions for demonstration."""
     hints: List[str] = []
     domain = payload.get("domain")
-    symptom = payload.get("primary_symptom", "").lower()
+    symptom = payload.get("primary_symptom") or ""
 
     if domain == "NCD":
-        if "เวียน" in symptom or "หน้ามืด" in symptom:
+        if _DIZZY_RE.search(symptom):
             hints.append("ตรวจระดับน้ำตาลและความดัน")
-        if payload.get("bp_sys") and payload.get("bp_sys") > 140:
+        bp_sys = payload.get("bp_sys")
+        if bp_sys and bp_sys > 140:
             hints.append("อาจเกี่ยวข้องกับความดันโลหิตสูง")
-        if payload.get("glucose") and payload.get("glucose") > 140:
+        glucose = payload.get("glucose")
+        if glucose and glucose > 140:
             hints.append("ติดตามเบาหวาน")
     elif domain == "MH":
-        if payload.get("phq9") and payload["phq9"] >= 10:
+        phq9 = payload.get("phq9")
+        if phq9 and phq9 >= 10:
             hints.append("อาจมีภาวะซึมเศร้าระดับปานกลาง")
-        if payload.get("gad7") and payload["gad7"] >= 10:
+        gad7 = payload.get("gad7")
+        if gad7 and gad7 >= 10:
             hints.append("อาจมีความวิตกกังวลสูง")
-        if payload.get("isi") and payload["isi"] >= 15:
+        isi = payload.get("isi")
+        if isi and isi >= 15:
             hints.append("ภาวะนอนไม่หลับระดับปานกลาง")
 
     if not hints:
@@ -2,20 +2,29 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
-from typing import List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, get_args
 
+import orjson
 from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import bindparam, exists, insert, select
 from sqlalchemy.orm import Session
 
-from .db import get_db
-from .logic.trends import confidence_from_points, ewma, interpret_trend, linear_slope
+from .db import INIT_DB, get_db, init_db, warm_pool
+from .logic.trends import (
+    cached_ewma,
+    cached_linear_slope,
+    confidence_from_points,
+    interpret_trend,
+    linear_slopes,
+)
 from .logic.triage import mock_condition_hints, triage_level_from_inputs
 from . import models, schemas
 
 
-app = FastAPI(title="AI Health Assistant API")
+app = FastAPI(title="AI Health Assistant API", default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -30,28 +39,52 @@ def health_check():
     return {"status": "ok"}
 
 
+_EPISODE_EXISTS = select(exists().where(models.Episode.id == bindparam("episode_id")))
+
+
+def _observation_out(observation_id: int, observation_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": observation_id,
+        "episode_id": observation_data["episode_id"],
+        "date": observation_data["date"],
+        "data": {k: v for k, v in observation_data.items() if k not in {"episode_id", "date"}},
+    }
+
+
 @app.post("/observe")
 def create_observation(payload: schemas.ObservationIn, db: Session = Depends(get_db)):
-    episode = db.get(models.Episode, payload.episode_id)
-    if episode is None:
+    if not db.execute(_EPISODE_EXISTS, {"episode_id": payload.episode_id}).scalar():
         raise HTTPException(status_code=404, detail="Episode not found")
 
     observation_data = payload.model_dump()
-    observation = models.Observation(**observation_data)
-    db.add(observation)
-    db.flush()
+    # RETURNING hands back the new id in the INSERT itself, without a unit-of-work flush.
+    observation_id = db.execute(
+        insert(models.Observation).values(**observation_data).returning(models.Observation.id)
+    ).scalar_one()
 
-    return {
-        "id": observation.id,
-        "episode_id": observation.episode_id,
-        "date": observation.date,
-        "data": {k: getattr(observation, k) for k in observation_data if k not in {"episode_id", "date"}},
-    }
+    return _observation_out(observation_id, observation_data)
 
 
-@app.post("/analyze", response_model=schemas.AnalyzeOut)
-def analyze(payload: schemas.AnalyzeIn):
-    data = payload.model_dump()
+@app.post("/observe/batch")
+def create_observations(payload: schemas.ObservationBatchIn, db: Session = Depends(get_db)):
+    """Record many observations with one episode check and one multi-row INSERT."""
+    rows = [observation.model_dump() for observation in payload.observations]
+    episode_ids = {row["episode_id"] for row in rows}
+    found = db.execute(select(models.Episode.id).where(models.Episode.id.in_(episode_ids))).scalars().all()
+    if len(found) != len(episode_ids):
+        raise HTTPException(status_code=404, detail="Episode not found")
+
+    observation_ids = db.execute(
+        insert(models.Observation).returning(models.Observation.id, sort_by_parameter_order=True),
+        rows,
+    ).scalars().all()
+    return [_observation_out(observation_id, row) for observation_id, row in zip(observation_ids, rows)]
+
+
+@lru_cache(maxsize=1024)
+def _analyze_payload(payload_json: bytes) -> schemas.AnalyzeOut:
+    """Run triage for one canonical payload; /analyze is pure, so identical payloads share a result."""
+    data = orjson.loads(payload_json)
     triage_level, actions, rationale = triage_level_from_inputs(data)
     hints = mock_condition_hints(data)
     return schemas.AnalyzeOut(
@@ -62,45 +95,98 @@ def analyze(payload: schemas.AnalyzeIn):
     )
 
 
-@app.post("/trend", response_model=schemas.TrendOut)
-def analyze_trend(payload: schemas.TrendRequest, db: Session = Depends(get_db)):
-    stmt = select(models.Observation).where(models.Observation.episode_id == payload.episode_id)
-    if payload.days:
-        start_date = date.today() - timedelta(days=payload.days)
+@app.post("/analyze", response_model=schemas.AnalyzeOut)
+def analyze(payload: schemas.AnalyzeIn):
+    return _analyze_payload(orjson.dumps(payload.model_dump(), option=orjson.OPT_SORT_KEYS))
+
+
+def _since(days: int | None) -> date | None:
+    return date.today() - timedelta(days=days) if days else None
+
+
+def _load_observations(db: Session, episode_id: int, days: int | None) -> List[models.Observation]:
+    stmt = select(models.Observation).where(models.Observation.episode_id == episode_id)
+    start_date = _since(days)
+    if start_date:
         stmt = stmt.where(models.Observation.date >= start_date)
 
     stmt = stmt.order_by(models.Observation.date.asc())
-    observations: List[models.Observation] = db.execute(stmt).scalars().all()
+    return db.execute(stmt).scalars().all()
+
+
+# One prebuilt statement per metric; an open-ended window binds date.min as the lower bound.
+_METRIC_POINT_STMTS = {
+    metric: select(models.Observation.date, getattr(models.Observation, metric))
+    .where(
+        models.Observation.episode_id == bindparam("episode_id"),
+        models.Observation.date >= bindparam("since"),
+        getattr(models.Observation, metric).is_not(None),
+    )
+    .order_by(models.Observation.date.asc())
+    for metric in get_args(schemas.TrendMetric)
+}
+
+
+def _load_metric_points(db: Session, episode_id: int, metric: str, days: int | None) -> List[Tuple[date, float]]:
+    """Load only the date and value columns of one metric, skipping missing values in SQL."""
+    params = {"episode_id": episode_id, "since": _since(days) or date.min}
+    return [(obs_date, value) for obs_date, value in db.execute(_METRIC_POINT_STMTS[metric], params)]
+
 
-    metric_values = []
+def _observation_points(observations: List[models.Observation], metric: str) -> List[Tuple[date, float]]:
     points = []
     for obs in observations:
-        value = getattr(obs, payload.metric)
-        if value is None:
-            continue
-        metric_values.append(value)
-        points.append((obs.date, value))
-
-    slope = linear_slope(points) if points else 0.0
-    trend_label = interpret_trend(payload.metric, slope)
-    ewma_values = ewma(metric_values) if metric_values else []
-
-    response_points = [schemas.TrendPoint(date=p[0], value=p[1]) for p in points]
-    confidence = confidence_from_points(points)
-
-    return schemas.TrendOut(
-        metric=payload.metric,
-        points=response_points,
-        ewma=ewma_values,
-        slope_per_day=slope,
-        trend=trend_label,
-        confidence=confidence,
+        value = getattr(obs, metric)
+        if value is not None:
+            points.append((obs.date, value))
+    return points
+
+
+def _summarize_trend(
+    metric: str,
+    points: List[Tuple[date, float]],
+    slope: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Build a ``TrendOut``-shaped dict straight from the raw points, without per-point models."""
+    if slope is None:
+        slope = cached_linear_slope(points) if points else 0.0
+    metric_values = [value for _, value in points]
+
+    return {
+        "metric": metric,
+        "points": [{"date": point_date, "value": value} for point_date, value in points],
+        "ewma": cached_ewma(metric_values) if metric_values else [],
+        "slope_per_day": slope,
+        "trend": interpret_trend(metric, slope),
+        "confidence": confidence_from_points(points),
+    }
+
+
+@app.post("/trend", response_model=schemas.TrendOut)
+def analyze_trend(payload: schemas.TrendRequest, db: Session = Depends(get_db)):
+    points = _load_metric_points(db, payload.episode_id, payload.metric, payload.days)
+    # Return the response directly so FastAPI does not validate and re-encode it as TrendOut models.
+    return ORJSONResponse(_summarize_trend(payload.metric, points))
+
+
+@app.post("/trend/batch", response_model=schemas.TrendBatchOut)
+def analyze_trend_batch(payload: schemas.TrendBatchRequest, db: Session = Depends(get_db)):
+    """Analyze several metrics of one episode with a single query and round-trip."""
+    observations = _load_observations(db, payload.episode_id, payload.days)
+    metrics = dict.fromkeys(payload.metrics or get_args(schemas.TrendMetric))
+    slopes = linear_slopes(
+        [obs.date for obs in observations],
+        {metric: [getattr(obs, metric) for obs in observations] for metric in metrics},
     )
+    series = {
+        metric: _summarize_trend(metric, _observation_points(observations, metric), slopes[metric])
+        for metric in metrics
+    }
+    return ORJSONResponse({"episode_id": payload.episode_id, "series": series})
 
 
 @app.on_event("startup")
 def ensure_tables_exist():
-    # Importing models already creates tables via metadata.create_all
-    from . import models  # noqa: F401
-
-    _ = models  # keep reference for linters
+    if INIT_DB:
+        init_db()
+    warm_pool()
@@ -4,10 +4,10 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import List, Optional
 
-from sqlalchemy import Date, DateTime, Enum, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Date, DateTime, Enum, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .db import Base, engine
+from .db import Base
 
 
 class User(Base):
@@ -41,9 +41,11 @@ class Episode(Base):
 
 class Observation(Base):
     __tablename__ = "observations"
+    # Serves the trend queries' episode filter, date window, and date ordering from one index.
+    __table_args__ = (Index("ix_observations_episode_id_date", "episode_id", "date"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    episode_id: Mapped[int] = mapped_column(ForeignKey("episodes.id", ondelete="CASCADE"), nullable=False, index=True)
+    episode_id: Mapped[int] = mapped_column(ForeignKey("episodes.id", ondelete="CASCADE"), nullable=False)
     date: Mapped[date] = mapped_column(Date, nullable=False)
     bp_sys: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     bp_dia: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
@@ -57,6 +59,3 @@ class Observation(Base):
 
     episode: Mapped[Episode] = relationship(back_populates="observations")
 
-
-# Create tables when module is imported
-Base.metadata.create_all(bind=engine)
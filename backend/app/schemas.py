@@ -2,14 +2,14 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Dict, List, Literal, Optional
+from typing import Annotated, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
 
 class ObservationIn(BaseModel):
     episode_id: int
-    date: date = Field(description="Date of the observation")
+    date: Annotated[date, Field(description="Date of the observation")]
     bp_sys: Optional[float] = None
     bp_dia: Optional[float] = None
     hr: Optional[float] = None
@@ -21,6 +21,14 @@ class ObservationIn(BaseModel):
     isi: Optional[float] = None
 
 
+class ObservationBatchIn(BaseModel):
+    observations: List[ObservationIn] = Field(
+        min_length=1,
+        max_length=1000,
+        description="Observations to record in a single transaction",
+    )
+
+
 class AnalyzeIn(BaseModel):
     age: int
     sex: Literal["M", "F", "O"]
@@ -50,19 +58,32 @@ class AnalyzeOut(BaseModel):
     hints: List[str]
 
 
+TrendMetric = Literal[
+    "bp_sys",
+    "bp_dia",
+    "hr",
+    "weight",
+    "waist",
+    "glucose",
+    "phq9",
+    "gad7",
+    "isi",
+]
+
+
 class TrendRequest(BaseModel):
     episode_id: int
-    metric: Literal[
-        "bp_sys",
-        "bp_dia",
-        "hr",
-        "weight",
-        "waist",
-        "glucose",
-        "phq9",
-        "gad7",
-        "isi",
-    ]
+    metric: TrendMetric
+    days: Optional[int] = Field(default=30, ge=1, description="Number of days to look back")
+
+
+class TrendBatchRequest(BaseModel):
+    episode_id: int
+    metrics: Optional[List[TrendMetric]] = Field(
+        default=None,
+        min_length=1,
+        description="Metrics to analyze in a single call; omit to receive every metric",
+    )
     days: Optional[int] = Field(default=30, ge=1, description="Number of days to look back")
 
 
@@ -78,3 +99,8 @@ class TrendOut(BaseModel):
     slope_per_day: float
     trend: Literal["ดีขึ้น", "ทรงตัว", "แย่ลง"]
     confidence: Literal["ต่ำ", "กลาง", "สูง"]
+
+
+class TrendBatchOut(BaseModel):
+    episode_id: int
+    series: Dict[str, TrendOut]
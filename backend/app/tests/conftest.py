@@ -0,0 +1,52 @@
+"""Shared fixtures for the backend API tests."""
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("fastapi")
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app import models
+from backend.app.db import Base, get_db
+from backend.app.main import app
+
+
+@pytest.fixture()
+def session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    def _get_db():
+        db = factory()
+        try:
+            yield db
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = _get_db
+    yield factory
+    app.dependency_overrides.pop(get_db, None)
+    engine.dispose()
+
+
+@pytest.fixture()
+def episode_id(session_factory):
+    with session_factory() as db:
+        user = models.User()
+        db.add(user)
+        db.flush()
+        episode = models.Episode(
+            user_id=user.id, domain="NCD", started_at=datetime(2024, 5, 1), primary_symptom="ปวดหัว"
+        )
+        db.add(episode)
+        db.commit()
+        return episode.id
@@ -27,3 +27,38 @@ def test_moderate_severity_promotes_to_yellow():
     assert data["triage_level"] == "เหลือง"
     assert "นัดพบแพทย์ภายใน 24-48 ชั่วโมง" in data["actions"]
     assert "ระดับอาการปานกลาง" in data["rationale"]
+
+
+def test_dizziness_suggests_glucose_and_pressure_check():
+    payload = {
+        "age": 55,
+        "sex": "M",
+        "domain": "NCD",
+        "primary_symptom": "เวียนศีรษะตอนเช้า",
+        "red_flag_answers": {},
+    }
+
+    response = client.post("/analyze", json=payload)
+    assert response.status_code == 200
+    assert "ตรวจระดับน้ำตาลและความดัน" in response.json()["hints"]
+
+
+def test_identical_payloads_reuse_cached_analysis():
+    from backend.app.main import _analyze_payload
+
+    payload = {
+        "age": 41,
+        "sex": "O",
+        "domain": "MH",
+        "primary_symptom": "นอนไม่หลับ",
+        "phq9": 12,
+        "red_flag_answers": {"self_harm": False, "chest_pain": False},
+    }
+    reordered = {**payload, "red_flag_answers": {"chest_pain": False, "self_harm": False}}
+
+    first = client.post("/analyze", json=payload)
+    hits = _analyze_payload.cache_info().hits
+    second = client.post("/analyze", json=reordered)
+
+    assert _analyze_payload.cache_info().hits == hits + 1
+    assert second.json() == first.json()
@@ -0,0 +1,45 @@
+"""Tests for the /observe endpoints."""
+import pytest
+
+fastapi = pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from backend.app import models
+from backend.app.main import app
+
+
+client = TestClient(app)
+
+
+def test_observe_batch_returns_ids_in_input_order(session_factory, episode_id):
+    observations = [
+        {"episode_id": episode_id, "date": f"2024-05-{day:02d}", "hr": 60.0 + day}
+        for day in (9, 3, 7, 1)
+    ]
+
+    response = client.post("/observe/batch", json={"observations": observations})
+
+    assert response.status_code == 200, response.text
+    results = response.json()
+    assert [(item["date"], item["data"]["hr"]) for item in results] == [
+        (obs["date"], obs["hr"]) for obs in observations
+    ]
+
+    with session_factory() as db:
+        stored = dict(db.execute(select(models.Observation.id, models.Observation.hr)).all())
+    assert [stored[item["id"]] for item in results] == [obs["hr"] for obs in observations]
+
+
+def test_observe_batch_rejects_unknown_episode_without_inserting(session_factory, episode_id):
+    observations = [
+        {"episode_id": episode_id, "date": "2024-05-02", "hr": 70.0},
+        {"episode_id": episode_id + 999, "date": "2024-05-03", "hr": 71.0},
+    ]
+
+    response = client.post("/observe/batch", json={"observations": observations})
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Episode not found"}
+    with session_factory() as db:
+        assert db.execute(select(models.Observation.id)).first() is None
@@ -0,0 +1,81 @@
+"""Tests for the /trend endpoints."""
+from datetime import date, timedelta
+
+import pytest
+
+fastapi = pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+
+from backend.app import models
+from backend.app.main import app
+
+
+client = TestClient(app)
+
+
+@pytest.fixture()
+def observed_episode_id(session_factory, episode_id):
+    today = date.today()
+    with session_factory() as db:
+        # Outside the default 30-day window.
+        db.add(models.Observation(episode_id=episode_id, date=today - timedelta(days=40), hr=200.0, weight=120.0))
+        for offset in range(10):
+            db.add(
+                models.Observation(
+                    episode_id=episode_id,
+                    date=today - timedelta(days=9 - offset),
+                    hr=70.0 + 0.5 * offset,
+                    weight=80.0 - 0.1 * offset,
+                    bp_sys=130.0 - offset if offset % 4 == 0 else None,
+                )
+            )
+        db.commit()
+    return episode_id
+
+
+def test_trend_uses_days_window(observed_episode_id):
+    recent = client.post("/trend", json={"episode_id": observed_episode_id, "metric": "hr"})
+    assert recent.status_code == 200, recent.text
+    body = recent.json()
+    assert body["metric"] == "hr"
+    assert [point["value"] for point in body["points"]] == [70.0 + 0.5 * offset for offset in range(10)]
+    assert len(body["ewma"]) == 10
+    assert body["slope_per_day"] == pytest.approx(0.5)
+
+    wider = client.post("/trend", json={"episode_id": observed_episode_id, "metric": "hr", "days": 60})
+    assert wider.status_code == 200, wider.text
+    assert len(wider.json()["points"]) == 11
+    assert wider.json()["points"][0]["value"] == 200.0
+
+
+def test_trend_batch_analyzes_each_metric(observed_episode_id):
+    response = client.post(
+        "/trend/batch",
+        json={"episode_id": observed_episode_id, "metrics": ["hr", "weight", "bp_sys"]},
+    )
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["episode_id"] == observed_episode_id
+    series = body["series"]
+    assert list(series) == ["hr", "weight", "bp_sys"]
+    assert {metric: len(item["points"]) for metric, item in series.items()} == {"hr": 10, "weight": 10, "bp_sys": 3}
+    assert series["hr"]["slope_per_day"] == pytest.approx(0.5)
+    assert series["weight"]["slope_per_day"] == pytest.approx(-0.1)
+    assert series["bp_sys"]["slope_per_day"] == pytest.approx(-1.0)
+
+    single = client.post("/trend", json={"episode_id": observed_episode_id, "metric": "weight"}).json()
+    assert series["weight"] == single
+
+
+def test_trend_for_unknown_episode_is_empty(session_factory, episode_id):
+    response = client.post("/trend", json={"episode_id": episode_id + 999, "metric": "hr"})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["points"] == []
+    assert body["ewma"] == []
+    assert body["slope_per_day"] == 0.0
+
+    batch = client.post("/trend/batch", json={"episode_id": episode_id + 999, "metrics": ["hr", "weight"]})
+    assert batch.status_code == 200, batch.text
+    assert {metric: item["points"] for metric, item in batch.json()["series"].items()} == {"hr": [], "weight": []}
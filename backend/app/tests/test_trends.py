@@ -0,0 +1,83 @@
+"""Tests for the trend analytics helpers."""
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from backend.app.logic.trends import cached_ewma, cached_linear_slope, ewma, linear_slope, linear_slopes
+
+
+def _reference_ewma(values, alpha=0.3):
+    smoothed = [values[0]]
+    for value in values[1:]:
+        smoothed.append(alpha * value + (1 - alpha) * smoothed[-1])
+    return smoothed
+
+
+@pytest.mark.parametrize("length", [2, 50, 3000])
+@pytest.mark.parametrize("alpha", [0.0, 0.05, 0.3, 0.99, 1.0])
+def test_ewma_matches_recurrence(alpha, length):
+    values = [float((i * 37) % 11) - 3.5 for i in range(length)]
+
+    assert ewma(values, alpha) == pytest.approx(_reference_ewma(values, alpha), rel=1e-9, abs=1e-9)
+
+
+def test_ewma_handles_empty_and_single_values():
+    assert ewma([]) == []
+    assert ewma([4.0]) == [4.0]
+
+
+def test_linear_slope_per_day():
+    start = date(2024, 1, 1)
+    points = [(start + timedelta(days=2 * i), 100.0 + 3.0 * i) for i in range(10)]
+
+    assert linear_slope(points) == pytest.approx(1.5)
+
+
+@pytest.mark.parametrize("count", [5, 399, 400, 2000])
+def test_linear_slope_paths_agree(count):
+    start = date(2024, 1, 1)
+    points = [(start + timedelta(days=i + i // 3), 80.0 + ((i * 7) % 5) - 0.25 * i) for i in range(count)]
+    days = [(d - start).days for d, _ in points]
+    values = [v for _, v in points]
+    mean_x = sum(days) / count
+    mean_y = sum(values) / count
+    expected = sum((x - mean_x) * (y - mean_y) for x, y in zip(days, values)) / sum((x - mean_x) ** 2 for x in days)
+
+    assert linear_slope(points) == pytest.approx(expected)
+
+
+def test_linear_slope_degenerate_inputs():
+    today = date(2024, 1, 1)
+
+    assert linear_slope([]) == 0.0
+    assert linear_slope([(today, 1.0)]) == 0.0
+    assert linear_slope([(today, 1.0), (today, 5.0)]) == 0.0
+
+
+def test_cached_helpers_return_fresh_results():
+    values = [1.0, 2.0, 3.0]
+    first = cached_ewma(values)
+    first.append(99.0)
+
+    assert cached_ewma(values) == ewma(values)
+    points = [(date(2024, 1, 1), 1.0), (date(2024, 1, 3), 2.0)]
+    assert cached_linear_slope(points) == linear_slope(points)
+
+
+def test_linear_slopes_skip_missing_values_per_metric():
+    start = date(2024, 1, 1)
+    days = [start + timedelta(days=i) for i in range(40)]
+    series = {
+        "bp_sys": [120.0 + 0.5 * i for i in range(40)],
+        "hr": [None if i % 3 else 70.0 - 0.2 * i for i in range(40)],
+        "glucose": [None] * 39 + [150.0],
+        "isi": [None] * 40,
+    }
+
+    slopes = linear_slopes(days, series)
+
+    for name, values in series.items():
+        points = [(day, value) for day, value in zip(days, values) if value is not None]
+        assert slopes[name] == pytest.approx(linear_slope(points), abs=1e-12)
@@ -0,0 +1,18 @@
+"""Composite indexes for per-user episode and per-episode observation listings."""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0002_composite_indexes"
+down_revision = "0001_create_tables"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_episodes_user_id_started_at", "episodes", ["user_id", "started_at"])
+    op.create_index("ix_observations_episode_id_date", "observations", ["episode_id", "date"])
+
+
+def downgrade():
+    op.drop_index("ix_observations_episode_id_date", table_name="observations")
+    op.drop_index("ix_episodes_user_id_started_at", table_name="episodes")
@@ -0,0 +1,50 @@
+"""Store JSON columns as JSONB on PostgreSQL."""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0003_jsonb_columns"
+down_revision = "0002_composite_indexes"
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = (
+    ("users", "chronic_conditions"),
+    ("users", "allergies"),
+    ("users", "meds"),
+    ("users", "habits"),
+    ("observations", "symptom_scores"),
+    ("observations", "side_effects"),
+    ("observations", "interventions"),
+    ("observations", "vitals"),
+    ("observations", "mh_scales"),
+    ("recommendations", "condition_hints"),
+    ("recommendations", "actions"),
+)
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            postgresql_using=f"{column}::json",
+        )
@@ -0,0 +1,43 @@
+"""Generate bookkeeping timestamp defaults in the database instead of in Python.
+
+Domain timestamps (episodes.started_at, observations.date) keep their
+Python-side default so they retain microsecond resolution for ordering.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0004_server_timestamps"
+down_revision = "0003_jsonb_columns"
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = (
+    ("users", "created_at"),
+    ("users", "updated_at"),
+    ("episodes", "created_at"),
+    ("episodes", "updated_at"),
+    ("observations", "created_at"),
+    ("recommendations", "created_at"),
+)
+
+
+def _utcnow_default() -> sa.TextClause:
+    if op.get_bind().dialect.name == "postgresql":
+        return sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+    return sa.text("CURRENT_TIMESTAMP")
+
+
+def _set_defaults(server_default) -> None:
+    for table in dict.fromkeys(table for table, _ in TIMESTAMP_COLUMNS):
+        with op.batch_alter_table(table) as batch_op:
+            for column in (column for t, column in TIMESTAMP_COLUMNS if t == table):
+                batch_op.alter_column(column, existing_type=sa.DateTime(), server_default=server_default)
+
+
+def upgrade():
+    _set_defaults(_utcnow_default())
+
+
+def downgrade():
+    _set_defaults(None)
@@ -1,23 +1,76 @@
 """Database CRUD operations for the Health AI Assistant."""
 from __future__ import annotations
 
-from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, TypeVar
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, exists, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from . import models, schemas
 
+_ModelT = TypeVar("_ModelT", bound=models.Base)
+
+
+# Hot-path statements are built once and reused with bound parameters.
+_USER_BY_EMAIL = select(models.User).where(models.User.email == bindparam("email"))
+_EMAIL_EXISTS = select(exists().where(models.User.email == bindparam("email")))
+_EPISODE_FOR_USER = select(models.Episode).where(
+    models.Episode.id == bindparam("episode_id"), models.Episode.user_id == bindparam("user_id")
+)
+_EPISODE_DETAIL_FOR_USER = _EPISODE_FOR_USER.options(
+    selectinload(models.Episode.observations),
+    selectinload(models.Episode.recommendations),
+)
+_EPISODES_FOR_USER = (
+    select(models.Episode)
+    .where(models.Episode.user_id == bindparam("user_id"))
+    .order_by(models.Episode.started_at.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_OBSERVATIONS_FOR_EPISODE = (
+    select(models.Observation)
+    .where(models.Observation.episode_id == bindparam("episode_id"))
+    .order_by(models.Observation.date.asc())
+)
+_OBSERVATION_ROWS_FOR_EPISODE = (
+    select(
+        models.Observation.id,
+        models.Observation.date,
+        models.Observation.symptom_scores,
+        models.Observation.vitals,
+        models.Observation.mh_scales,
+        models.Observation.interventions,
+    )
+    .where(models.Observation.episode_id == bindparam("episode_id"))
+    .order_by(models.Observation.date.asc())
+)
+_RECOMMENDATION_BY_ID = (
+    select(models.Recommendation)
+    .options(joinedload(models.Recommendation.episode))
+    .where(models.Recommendation.id == bindparam("recommendation_id"))
+)
+
+
+def _persist(db: Session, instance: _ModelT) -> _ModelT:
+    """Add, commit and reload ``instance``."""
+
+    db.add(instance)
+    db.commit()
+    db.refresh(instance)
+    return instance
+
 
 # User operations
 
 def get_user_by_email(db: Session, email: str) -> Optional[models.User]:
-    return (
-        db.execute(select(models.User).where(models.User.email == email))
-        .scalar_one_or_none()
-    )
+    return db.execute(_USER_BY_EMAIL, {"email": email}).scalar_one_or_none()
+
+
+def email_exists(db: Session, email: str) -> bool:
+    return db.execute(_EMAIL_EXISTS, {"email": email}).scalar()
 
 
 def create_user(db: Session, user: schemas.UserCreate, password_hash: str) -> models.User:
@@ -32,10 +85,13 @@ def create_user(db: Session, user: schemas.UserCreate, password_hash: str) -> mo
         meds=user.meds,
         habits=user.habits,
     )
-    db.add(db_user)
+    return _persist(db, db_user)
+
+
+def update_password_hash(db: Session, user: models.User, password_hash: str) -> models.User:
+    user.password_hash = password_hash
     db.commit()
-    db.refresh(db_user)
-    return db_user
+    return user
 
 
 # Episode operations
@@ -44,35 +100,35 @@ def create_episode(db: Session, *, user_id: UUID, episode: schemas.EpisodeCreate
     db_episode = models.Episode(
         user_id=user_id,
         domain=episode.domain,
-        started_at=episode.started_at or datetime.utcnow(),
         primary_symptom=episode.primary_symptom,
         severity_0_10=episode.severity_0_10,
         notes=episode.notes,
     )
-    db.add(db_episode)
-    db.commit()
-    db.refresh(db_episode)
-    return db_episode
+    # Left unset, the column default stamps the insert time.
+    if episode.started_at is not None:
+        db_episode.started_at = episode.started_at
+    return _persist(db, db_episode)
 
 
 def get_episode(db: Session, episode_id: UUID, user_id: UUID) -> Optional[models.Episode]:
-    stmt = select(models.Episode).where(
-        models.Episode.id == episode_id, models.Episode.user_id == user_id
-    )
-    return db.execute(stmt).scalar_one_or_none()
+    return db.execute(
+        _EPISODE_FOR_USER, {"episode_id": episode_id, "user_id": user_id}
+    ).scalar_one_or_none()
+
+
+def get_episode_detail(db: Session, episode_id: UUID, user_id: UUID) -> Optional[models.Episode]:
+    """Return an episode with its observations and recommendations loaded up front."""
+
+    return db.execute(
+        _EPISODE_DETAIL_FOR_USER, {"episode_id": episode_id, "user_id": user_id}
+    ).scalar_one_or_none()
 
 
 def list_episodes(
     db: Session, user_id: UUID, skip: int = 0, limit: int = 10
 ) -> List[models.Episode]:
-    stmt = (
-        select(models.Episode)
-        .where(models.Episode.user_id == user_id)
-        .order_by(models.Episode.started_at.desc())
-        .offset(skip)
-        .limit(limit)
-    )
-    return list(db.execute(stmt).scalars())
+    params = {"user_id": user_id, "skip": skip, "limit": limit}
+    return db.execute(_EPISODES_FOR_USER, params).scalars().all()
 
 
 # Observation operations
@@ -82,26 +138,28 @@ def create_observation(
 ) -> models.Observation:
     db_observation = models.Observation(
         episode_id=episode_id,
-        date=observation.date or datetime.utcnow(),
         symptom_scores=observation.symptom_scores,
         side_effects=observation.side_effects,
         interventions=observation.interventions,
         vitals=observation.vitals,
         mh_scales=observation.mh_scales,
     )
-    db.add(db_observation)
-    db.commit()
-    db.refresh(db_observation)
-    return db_observation
+    if observation.date is not None:
+        db_observation.date = observation.date
+    return _persist(db, db_observation)
 
 
 def get_observations_for_episode(db: Session, episode_id: UUID) -> List[models.Observation]:
-    stmt = (
-        select(models.Observation)
-        .where(models.Observation.episode_id == episode_id)
-        .order_by(models.Observation.date.asc())
-    )
-    return list(db.execute(stmt).scalars())
+    return db.execute(_OBSERVATIONS_FOR_EPISODE, {"episode_id": episode_id}).scalars().all()
+
+
+def get_observation_rows(db: Session, episode_id: UUID) -> List[Row]:
+    """Return plain column rows for an episode's observations, ordered by date.
+
+    Skips ORM instance construction and identity-map bookkeeping for read-only callers.
+    """
+
+    return db.execute(_OBSERVATION_ROWS_FOR_EPISODE, {"episode_id": episode_id}).all()
 
 
 # Recommendation operations
@@ -116,14 +174,12 @@ def create_recommendation(
         rationale=recommendation.rationale,
         actions=recommendation.actions,
     )
-    db.add(db_recommendation)
-    db.commit()
-    db.refresh(db_recommendation)
-    return db_recommendation
+    return _persist(db, db_recommendation)
 
 
 def get_recommendation(
     db: Session, recommendation_id: UUID
 ) -> Optional[models.Recommendation]:
-    stmt = select(models.Recommendation).where(models.Recommendation.id == recommendation_id)
-    return db.execute(stmt).scalar_one_or_none()
+    return db.execute(
+        _RECOMMENDATION_BY_ID, {"recommendation_id": recommendation_id}
+    ).scalar_one_or_none()
@@ -1,6 +1,13 @@
 """Dependency utilities for FastAPI routes."""
 from __future__ import annotations
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Tuple
+from uuid import UUID
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
@@ -8,22 +15,55 @@ from sqlalchemy.orm import Session
 from . import crud, models
 from .db import get_db
 from .services import decode_token
-from .settings import get_settings
-
-settings = get_settings()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# Verified access tokens, keyed by digest, so repeat requests skip signature checks.
+_TOKEN_CACHE_TTL_SECONDS = 60.0
+_TOKEN_CACHE_MAX_ENTRIES = 4096
+_token_cache: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+# get_current_user runs in the threadpool, so cache updates are serialised.
+_token_cache_lock = threading.Lock()
+
+
+def _token_subject(token: str) -> str:
+    """Return the subject of a valid access token, consulting the short-lived cache first."""
+
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    now = time.time()
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+        if cached is not None:
+            subject, expires_at = cached
+            if now < expires_at:
+                _token_cache.move_to_end(key)
+                return subject
+            del _token_cache[key]
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> models.User:
-    """Return the currently authenticated user."""
+    payload = decode_token(token, token_type="access")
+    with _token_cache_lock:
+        _token_cache[key] = (payload.sub, min(now + _TOKEN_CACHE_TTL_SECONDS, float(payload.exp)))
+        if len(_token_cache) > _TOKEN_CACHE_MAX_ENTRIES:
+            _token_cache.popitem(last=False)
+    return payload.sub
+
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> models.User:
+    """Return the currently authenticated user.
+
+    Declared sync so FastAPI runs the blocking session query in its threadpool.
+    """
 
     try:
-        payload = decode_token(token, token_type="access")
+        subject = _token_subject(token)
     except ValueError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
 
-    user = crud.get_user_by_email(db, payload.sub)
+    try:
+        user = db.get(models.User, UUID(subject))
+    except ValueError:
+        # Tokens issued before subjects became user ids carry the email instead.
+        user = crud.get_user_by_email(db, subject)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
     return user
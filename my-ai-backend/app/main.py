@@ -5,42 +5,119 @@ import logging
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from collections import defaultdict, deque
+from fastapi.responses import JSONResponse, ORJSONResponse
+from collections import OrderedDict
+from typing import Optional, Tuple
 import time
 
 from starlette.middleware.base import BaseHTTPMiddleware
 
+try:
+    import redis.asyncio as aioredis
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    aioredis = None  # type: ignore
+
 from .routes import auth, episodes, recommendations, users
+from .services import close_http_client, open_http_client
 from .settings import get_settings
 
 settings = get_settings()
 
 logger = logging.getLogger("healthai")
-logging.basicConfig(level=logging.INFO)
+# Configure the app logger once without reconfiguring the root logger.
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(levelname)s:%(name)s:%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
 
 class RateLimiterMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: FastAPI, calls: int, period: int):
+    """Fixed-window rate limiter keyed by client address.
+
+    With ``redis_url`` set, counters live in Redis so the limit holds across workers.
+    Otherwise, or if Redis is unreachable, windows are kept in a process-local LRU
+    capped at ``max_clients`` so memory stays bounded. After a Redis failure the
+    limiter stays local for ``redis_retry_interval`` seconds before trying again.
+    """
+
+    redis_retry_interval = 30.0
+
+    def __init__(
+        self,
+        app: FastAPI,
+        calls: int,
+        period: int,
+        max_clients: int = 10_000,
+        redis_url: Optional[str] = None,
+    ):
         super().__init__(app)
         self.calls = calls
         self.period = period
-        self.buckets = defaultdict(deque)
+        self.max_clients = max_clients
+        self.buckets: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+        self.redis = aioredis.from_url(redis_url) if redis_url and aioredis is not None else None
+        self._redis_retry_at: Optional[float] = None
+
+    async def _redis_retry_after(self, identifier: str) -> Optional[int]:
+        now = time.time()
+        window = int(now // self.period)
+        key = f"rl:{identifier}:{window}"
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, self.period)
+            count, _ = await pipe.execute()
+        if count > self.calls:
+            return max(1, int((window + 1) * self.period - now + 0.999))
+        return None
+
+    def _local_retry_after(self, identifier: str) -> Optional[int]:
+        now = time.monotonic()
+        window_start, count = self.buckets.get(identifier, (now, 0))
+        if now - window_start >= self.period:
+            window_start, count = now, 0
+        if count >= self.calls:
+            return max(1, int(window_start + self.period - now + 0.999))
+        self.buckets[identifier] = (window_start, count + 1)
+        self.buckets.move_to_end(identifier)
+        if len(self.buckets) > self.max_clients:
+            self.buckets.popitem(last=False)
+        return None
 
     async def dispatch(self, request, call_next):
         identifier = request.client.host if request.client else "anonymous"
-        now = time.monotonic()
-        bucket = self.buckets[identifier]
-        while bucket and bucket[0] <= now - self.period:
-            bucket.popleft()
-        if len(bucket) >= self.calls:
-            from fastapi import HTTPException
-            raise HTTPException(status_code=429, detail="Rate limit exceeded")
-        bucket.append(now)
+        retry_after = None
+        use_redis = self.redis is not None and (
+            self._redis_retry_at is None or time.monotonic() >= self._redis_retry_at
+        )
+        if use_redis:
+            try:
+                retry_after = await self._redis_retry_after(identifier)
+            except Exception as exc:
+                if self._redis_retry_at is None:
+                    logger.warning("Redis rate limiter unavailable, using local limits: %s", exc)
+                self._redis_retry_at = time.monotonic() + self.redis_retry_interval
+                use_redis = False
+            else:
+                if self._redis_retry_at is not None:
+                    logger.info("Redis rate limiter reachable again")
+                    self._redis_retry_at = None
+        if not use_redis:
+            retry_after = self._local_retry_after(identifier)
+
+        if retry_after is not None:
+            # Exceptions raised here bypass FastAPI's handlers, so answer directly.
+            return JSONResponse(
+                {"detail": "Rate limit exceeded"},
+                status_code=429,
+                headers={"Retry-After": str(retry_after)},
+            )
         response = await call_next(request)
         return response
 
 app = FastAPI(
     title=settings.app_name,
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
     openapi_tags=[
         {"name": "auth", "description": "Authentication operations"},
         {"name": "users", "description": "User profile endpoints"},
@@ -63,27 +140,38 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.add_middleware(RateLimiterMiddleware, calls=settings.rate_limit_calls, period=settings.rate_limit_period)
+app.add_middleware(
+    RateLimiterMiddleware,
+    calls=settings.rate_limit_calls,
+    period=settings.rate_limit_period,
+    redis_url=settings.redis_url,
+)
 
 
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
     """Log request lifecycle."""
 
-    logger.info("Handling request: %s %s", request.method, request.url)
+    if not logger.isEnabledFor(logging.INFO):
+        return await call_next(request)
+
+    path = request.url.path
+    logger.info("Handling request: %s %s", request.method, path)
     response = await call_next(request)
-    logger.info("Completed request: %s %s -> %s", request.method, request.url, response.status_code)
+    logger.info("Completed request: %s %s -> %s", request.method, path, response.status_code)
     return response
 
 
 @app.on_event("startup")
 async def startup_event():
     logger.info("Starting %s", settings.app_name)
+    open_http_client()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Stopping %s", settings.app_name)
+    await close_http_client()
 
 
 @app.get("/", tags=["root"])
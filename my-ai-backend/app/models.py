@@ -8,13 +8,16 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
     Text,
     UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 from sqlalchemy.orm import relationship
 
 from .db import Base
@@ -30,6 +33,26 @@ MeasurementTypeEnum = Enum(
 MeasurementSourceEnum = Enum(
     "manual", "device", "import", name="measurementsourceenum"
 )
+# Binary JSONB on PostgreSQL; plain JSON elsewhere (e.g. SQLite in tests).
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+class utcnow(FunctionElement):
+    """Database-side current UTC timestamp for naive DateTime columns."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC.
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _postgresql_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
 
 
 class User(Base):
@@ -43,13 +66,13 @@ class User(Base):
     name = Column(String(255), nullable=True)
     dob = Column(Date, nullable=True)
     sex = Column(SexEnum, nullable=True)
-    chronic_conditions = Column(JSON, default=list)
-    allergies = Column(JSON, default=list)
-    meds = Column(JSON, default=list)
-    habits = Column(JSON, default=list)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    chronic_conditions = Column(JSONType, default=list)
+    allergies = Column(JSONType, default=list)
+    meds = Column(JSONType, default=list)
+    habits = Column(JSONType, default=list)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False
     )
 
     episodes = relationship("Episode", back_populates="user", cascade="all, delete")
@@ -59,7 +82,10 @@ class Episode(Base):
     """Episode of care in either NCD or mental health domain."""
 
     __tablename__ = "episodes"
-    __table_args__ = (UniqueConstraint("id", "user_id"),)
+    __table_args__ = (
+        UniqueConstraint("id", "user_id"),
+        Index("ix_episodes_user_id_started_at", "user_id", "started_at"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -68,14 +94,17 @@ class Episode(Base):
     primary_symptom = Column(String(255), nullable=False)
     severity_0_10 = Column(Integer, nullable=False)
     notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False
     )
 
     user = relationship("User", back_populates="episodes")
     observations = relationship(
-        "Observation", back_populates="episode", cascade="all, delete-orphan"
+        "Observation",
+        back_populates="episode",
+        cascade="all, delete-orphan",
+        order_by="Observation.date",
     )
     recommendations = relationship(
         "Recommendation", back_populates="episode", cascade="all, delete-orphan"
@@ -86,16 +115,17 @@ class Observation(Base):
     """Observations recorded for an episode."""
 
     __tablename__ = "observations"
+    __table_args__ = (Index("ix_observations_episode_id_date", "episode_id", "date"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     episode_id = Column(UUID(as_uuid=True), ForeignKey("episodes.id"), nullable=False)
     date = Column(DateTime, default=datetime.utcnow, nullable=False)
-    symptom_scores = Column(JSON, default=dict)
-    side_effects = Column(JSON, default=list)
-    interventions = Column(JSON, default=list)
-    vitals = Column(JSON, default=dict)
-    mh_scales = Column(JSON, default=dict)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    symptom_scores = Column(JSONType, default=dict)
+    side_effects = Column(JSONType, default=list)
+    interventions = Column(JSONType, default=list)
+    vitals = Column(JSONType, default=dict)
+    mh_scales = Column(JSONType, default=dict)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
 
     episode = relationship("Episode", back_populates="observations")
 
@@ -118,10 +148,10 @@ class Recommendation(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     episode_id = Column(UUID(as_uuid=True), ForeignKey("episodes.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     triage_level = Column(TriageEnum, nullable=False)
-    condition_hints = Column(JSON, default=list)
+    condition_hints = Column(JSONType, default=list)
     rationale = Column(Text, nullable=False)
-    actions = Column(JSON, default=list)
+    actions = Column(JSONType, default=list)
 
     episode = relationship("Episode", back_populates="recommendations")
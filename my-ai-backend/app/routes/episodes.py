@@ -38,17 +38,11 @@ def get_episode(
     db: Session = Depends(get_db_session),
     current_user: models.User = Depends(get_current_user),
 ):
-    episode = crud.get_episode(db, episode_id=episode_id, user_id=current_user.id)
+    episode = crud.get_episode_detail(db, episode_id=episode_id, user_id=current_user.id)
     if not episode:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Episode not found")
 
-    observations = crud.get_observations_for_episode(db, episode_id)
-    recommendations = list(episode.recommendations)
-    base_detail = schemas.EpisodeDetail.model_validate(episode)
-    return base_detail.model_copy(update={
-        "observations": [schemas.ObservationRead.model_validate(obs) for obs in observations],
-        "recommendations": [schemas.RecommendationRead.model_validate(rec) for rec in recommendations],
-    })
+    return episode
 
 
 @router.post("/{episode_id}/observations", response_model=schemas.ObservationRead, status_code=status.HTTP_201_CREATED)
@@ -4,6 +4,7 @@ from __future__ import annotations
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from .. import crud, models, schemas
@@ -14,7 +15,7 @@ router = APIRouter(prefix="/recommendations", tags=["recommendations"])
 
 
 @router.post("", response_model=schemas.RecommendationRead, status_code=status.HTTP_201_CREATED)
-async def create_recommendation_endpoint(
+def create_recommendation_endpoint(
     recommendation_request: schemas.RecommendationCreate,
     db: Session = Depends(get_db_session),
     current_user: models.User = Depends(get_current_user),
@@ -32,13 +33,16 @@ async def run_recommender(
     db: Session = Depends(get_db_session),
     current_user: models.User = Depends(get_current_user),
 ):
-    episode = crud.get_episode(db, episode_id, current_user.id)
+    # The session is synchronous, so keep its queries off the event loop around the awaited model call.
+    episode = await run_in_threadpool(crud.get_episode, db, episode_id, current_user.id)
     if not episode:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Episode not found")
 
-    observations = crud.get_observations_for_episode(db, episode_id)
+    observations = await run_in_threadpool(crud.get_observation_rows, db, episode_id)
     recommendation_data = await predict_recommendation(episode, observations)
-    recommendation = crud.create_recommendation(db, episode_id=episode_id, recommendation=recommendation_data)
+    recommendation = await run_in_threadpool(
+        crud.create_recommendation, db, episode_id=episode_id, recommendation=recommendation_data
+    )
     return recommendation
 
 
@@ -2,11 +2,16 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, ConfigDict
 
+# Closed vocabularies validate as set membership rather than regex matches.
+Sex = Literal["M", "F", "O"]
+Domain = Literal["NCD", "MH"]
+TriageLevel = Literal["self-care", "primary-care", "urgent", "emergency"]
+
 
 class TimestampedModel(BaseModel):
     created_at: datetime
@@ -19,7 +24,7 @@ class UserBase(BaseModel):
     email: str = Field(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
     name: Optional[str] = None
     dob: Optional[date] = None
-    sex: Optional[str] = Field(default=None, pattern=r"^(M|F|O)$")
+    sex: Optional[Sex] = None
     chronic_conditions: List[str] = Field(default_factory=list)
     allergies: List[str] = Field(default_factory=list)
     meds: List[str] = Field(default_factory=list)
@@ -47,7 +52,7 @@ class TokenPayload(BaseModel):
 
 
 class EpisodeBase(BaseModel):
-    domain: str = Field(pattern=r"^(NCD|MH)$")
+    domain: Domain
     started_at: Optional[datetime] = None
     primary_symptom: str = Field(min_length=1)
     severity_0_10: int = Field(ge=0, le=10)
@@ -85,7 +90,7 @@ class ObservationRead(ObservationBase):
 
 
 class RecommendationBase(BaseModel):
-    triage_level: str = Field(pattern=r"^(self-care|primary-care|urgent|emergency)$")
+    triage_level: TriageLevel
     condition_hints: List[str] = Field(default_factory=list)
     rationale: str
     actions: List[str] = Field(default_factory=list)
@@ -93,7 +98,7 @@ class RecommendationBase(BaseModel):
 
 class RecommendationCreate(BaseModel):
     episode_id: UUID
-    triage_level: str = Field(pattern=r"^(self-care|primary-care|urgent|emergency)$")
+    triage_level: TriageLevel
     condition_hints: List[str] = Field(default_factory=list)
     rationale: str
     actions: List[str] = Field(default_factory=list)
@@ -1,15 +1,26 @@
 """Business logic services for authentication and recommendation generation."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple
 
-import base64
 import hashlib
 import hmac
-import json
 import logging
 import secrets
+import time
+
+import orjson
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from sqlalchemy.engine import Row
+
+try:
+    import pybase64 as base64  # SIMD-accelerated drop-in for the stdlib codec
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    import base64  # type: ignore[no-redef]
 
 try:
     import httpx
@@ -23,38 +34,83 @@ settings = get_settings()
 
 logger = logging.getLogger("healthai")
 
+_password_hasher = PasswordHasher(
+    time_cost=settings.argon2_time_cost,
+    memory_cost=settings.argon2_memory_cost,
+    parallelism=settings.argon2_parallelism,
+)
+# Fixed by the stored legacy hashes; must not change.
+_LEGACY_PBKDF2_ITERATIONS = 100_000
+
+_http_client: Optional["httpx.AsyncClient"] = None
+_HTTP_MAX_CONNECTIONS = 64
+_HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Short-lived cache of external model responses keyed by a digest of the request payload.
+_MODEL_CACHE_TTL_SECONDS = 300.0
+_MODEL_CACHE_MAX_ENTRIES = 256
+_model_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
 
 # Authentication helpers
 
 def hash_password(password: str) -> str:
-    """Hash a plain password using PBKDF2."""
+    """Hash a plain password using Argon2id."""
 
-    salt = secrets.token_hex(16)
-    derived = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt.encode("utf-8"), 100_000)
-    return f"{salt}${derived.hex()}"
+    return _password_hasher.hash(password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against a hashed password."""
-
+def _verify_legacy_password(plain_password: str, hashed_password: str) -> bool:
     try:
         salt, stored_hash = hashed_password.split("$", 1)
     except ValueError:
         return False
-    derived = hashlib.pbkdf2_hmac("sha256", plain_password.encode("utf-8"), salt.encode("utf-8"), 100_000)
+    derived = hashlib.pbkdf2_hmac("sha256", plain_password.encode("utf-8"), salt.encode("utf-8"), _LEGACY_PBKDF2_ITERATIONS)
     return hmac.compare_digest(stored_hash, derived.hex())
 
 
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a plain password against an Argon2id or legacy PBKDF2 hash."""
+
+    if not hashed_password.startswith("$argon2"):
+        return _verify_legacy_password(plain_password, hashed_password)
+    try:
+        return _password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Return True when a stored hash is legacy PBKDF2 or uses outdated Argon2 parameters."""
+
+    if not hashed_password.startswith("$argon2"):
+        return True
+    return _password_hasher.check_needs_rehash(hashed_password)
+
+
+# Every token shares the same header, so its encoded segment is computed once.
+_HEADER_SEGMENT = base64.urlsafe_b64encode(orjson.dumps({"alg": "HS256", "typ": "JWT"})).rstrip(b"=")
+
+
+@lru_cache(maxsize=None)
+def _hmac_template(secret: str) -> "hmac.HMAC":
+    """Return an HMAC keyed with ``secret``; callers ``copy()`` it to skip the key schedule."""
+
+    return hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def _sign(secret: str, signing_input: bytes) -> bytes:
+    mac = _hmac_template(secret).copy()
+    mac.update(signing_input)
+    return mac.digest()
+
+
 def _encode_token(payload: Dict[str, Any], secret: str) -> str:
-    header = {"alg": "HS256", "typ": "JWT"}
-    segments = []
-    for segment in (header, payload):
-        json_bytes = json.dumps(segment, separators=(",", ":"), default=str).encode("utf-8")
-        segments.append(base64.urlsafe_b64encode(json_bytes).rstrip(b"="))
-    signing_input = b".".join(segments)
-    signature = hmac.new(secret.encode("utf-8"), signing_input, hashlib.sha256).digest()
-    segments.append(base64.urlsafe_b64encode(signature).rstrip(b"="))
-    return b".".join(segments).decode("utf-8")
+    payload_segment = base64.urlsafe_b64encode(orjson.dumps(payload, default=str)).rstrip(b"=")
+    signing_input = _HEADER_SEGMENT + b"." + payload_segment
+    signature = base64.urlsafe_b64encode(_sign(secret, signing_input)).rstrip(b"=")
+    return (signing_input + b"." + signature).decode("utf-8")
 
 
 def _decode_token(token: str, secret: str) -> Dict[str, Any]:
@@ -63,34 +119,59 @@ def _decode_token(token: str, secret: str) -> Dict[str, Any]:
     except ValueError as exc:
         raise ValueError("Invalid token format") from exc
     signing_input = f"{header_b64}.{payload_b64}".encode("utf-8")
-    expected_sig = base64.urlsafe_b64encode(
-        hmac.new(secret.encode("utf-8"), signing_input, hashlib.sha256).digest()
-    ).rstrip(b"=")
-    if expected_sig.decode("utf-8") != signature_b64.rstrip("="):
+    # Compare the canonical unpadded encoding: urlsafe_b64decode would silently accept
+    # junk characters, newlines or the standard "+/" alphabet in the signature segment.
+    expected = base64.urlsafe_b64encode(_sign(secret, signing_input)).rstrip(b"=")
+    if not hmac.compare_digest(expected, signature_b64.encode("utf-8")):
         raise ValueError("Signature mismatch")
     padded_payload = payload_b64 + "=" * (-len(payload_b64) % 4)
-    payload = json.loads(base64.urlsafe_b64decode(padded_payload).decode("utf-8"))
+    payload = orjson.loads(base64.urlsafe_b64decode(padded_payload))
     return payload
 
 
+def _token_claims(
+    subject: str,
+    kind: str,
+    now: float,
+    expires_delta: Optional[timedelta] = None,
+    jti: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build the claim set for an ``access`` or ``refresh`` token issued at epoch second ``now``."""
+
+    if expires_delta is None:
+        minutes = settings.access_token_expire_minutes if kind == "access" else settings.refresh_token_expire_minutes
+        expires_delta = timedelta(minutes=minutes)
+    return {
+        "exp": int(now + expires_delta.total_seconds()),
+        "sub": subject,
+        "type": kind,
+        "jti": jti or secrets.token_hex(8),
+    }
+
+
 def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
 
-    expire = datetime.utcnow() + (
-        expires_delta or timedelta(minutes=settings.access_token_expire_minutes)
-    )
-    payload = {"exp": int(expire.timestamp()), "sub": subject, "type": "access", "jti": secrets.token_hex(8)}
-    return _encode_token(payload, settings.jwt_secret_key)
+    claims = _token_claims(subject, "access", time.time(), expires_delta)
+    return _encode_token(claims, settings.jwt_secret_key)
 
 
 def create_refresh_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT refresh token."""
 
-    expire = datetime.utcnow() + (
-        expires_delta or timedelta(minutes=settings.refresh_token_expire_minutes)
+    claims = _token_claims(subject, "refresh", time.time(), expires_delta)
+    return _encode_token(claims, settings.jwt_refresh_secret_key)
+
+
+def create_token_pair(subject: str) -> Tuple[str, str]:
+    """Create an access and refresh token for ``subject`` from one clock read and one random draw."""
+
+    now = time.time()
+    jti = secrets.token_hex(16)
+    return (
+        _encode_token(_token_claims(subject, "access", now, jti=jti[:16]), settings.jwt_secret_key),
+        _encode_token(_token_claims(subject, "refresh", now, jti=jti[16:]), settings.jwt_refresh_secret_key),
     )
-    payload = {"exp": int(expire.timestamp()), "sub": subject, "type": "refresh", "jti": secrets.token_hex(8)}
-    return _encode_token(payload, settings.jwt_refresh_secret_key)
 
 
 def decode_token(token: str, *, token_type: str) -> schemas.TokenPayload:
@@ -100,72 +181,63 @@ def decode_token(token: str, *, token_type: str) -> schemas.TokenPayload:
     payload = _decode_token(token, secret)
     if payload.get("type") != token_type:
         raise ValueError("Invalid token type")
-    if payload.get("exp") and datetime.utcnow().timestamp() > float(payload["exp"]):
+    # exp is epoch seconds; compare against the same clock deps uses for its token cache.
+    if payload.get("exp") and time.time() > float(payload["exp"]):
         raise ValueError("Token expired")
     return schemas.TokenPayload(**payload)
 
 
 # Recommender logic
 
-def _mh_rules(latest_observation: Optional[models.Observation]) -> Dict[str, Any]:
+# Ordered (phq9, gad7, triage, rationale) tiers; the first tier either score reaches wins.
+_MH_TIERS = (
+    (20, 15, "emergency", "Severe depressive/anxiety symptoms detected (PHQ-9/GAD-7)"),
+    (15, 13, "urgent", "Moderate to severe symptoms; recommend urgent follow-up"),
+    (10, 10, "primary-care", "Mild to moderate symptoms; schedule primary care or therapy visit"),
+)
+
+# Ordered (bp_sys, bp_dia, glucose, triage, rationale) tiers; the first tier any vital exceeds wins.
+_INF = float("inf")
+_NCD_TIERS = (
+    (180, 120, _INF, "emergency", "Hypertensive crisis detected"),
+    (160, 100, _INF, "urgent", "Severely elevated blood pressure"),
+    (_INF, _INF, 300, "urgent", "High glucose level"),
+    (140, 90, 200, "primary-care", "Above target vitals; primary care visit recommended"),
+)
+
+
+def _mh_rules(latest_observation: Optional[Row]) -> Dict[str, Any]:
     """Determine MH triage level based on mental health scales."""
 
-    triage = "self-care"
-    rationale_parts: List[str] = []
     if not latest_observation:
-        rationale_parts.append("No recent observations; defaulting to self-care")
-        return {"triage": triage, "rationale": "; ".join(rationale_parts)}
+        return {"triage": "self-care", "rationale": "No recent observations; defaulting to self-care"}
 
     scales = latest_observation.mh_scales or {}
     phq9 = scales.get("phq9", 0)
     gad7 = scales.get("gad7", 0)
-    if phq9 >= 20 or gad7 >= 15:
-        triage = "emergency"
-        rationale_parts.append("Severe depressive/anxiety symptoms detected (PHQ-9/GAD-7)")
-    elif phq9 >= 15 or gad7 >= 13:
-        triage = "urgent"
-        rationale_parts.append("Moderate to severe symptoms; recommend urgent follow-up")
-    elif phq9 >= 10 or gad7 >= 10:
-        triage = "primary-care"
-        rationale_parts.append("Mild to moderate symptoms; schedule primary care or therapy visit")
-    else:
-        rationale_parts.append("Scores within mild range; continue self-care strategies")
+    for phq9_min, gad7_min, triage, rationale in _MH_TIERS:
+        if phq9 >= phq9_min or gad7 >= gad7_min:
+            return {"triage": triage, "rationale": rationale}
+    return {"triage": "self-care", "rationale": "Scores within mild range; continue self-care strategies"}
 
-    return {"triage": triage, "rationale": "; ".join(rationale_parts)}
 
-
-def _ncd_rules(latest_observation: Optional[models.Observation]) -> Dict[str, Any]:
+def _ncd_rules(latest_observation: Optional[Row]) -> Dict[str, Any]:
     """Determine NCD triage level based on vitals."""
 
-    triage = "self-care"
-    rationale_parts: List[str] = []
     if not latest_observation:
-        rationale_parts.append("No recent vitals; defaulting to self-care")
-        return {"triage": triage, "rationale": "; ".join(rationale_parts)}
+        return {"triage": "self-care", "rationale": "No recent vitals; defaulting to self-care"}
 
     vitals = latest_observation.vitals or {}
     bp_sys = vitals.get("bp_sys", 0)
     bp_dia = vitals.get("bp_dia", 0)
     glucose = vitals.get("glucose", 0)
-    if bp_sys > 180 or bp_dia > 120:
-        triage = "emergency"
-        rationale_parts.append("Hypertensive crisis detected")
-    elif bp_sys > 160 or bp_dia > 100:
-        triage = "urgent"
-        rationale_parts.append("Severely elevated blood pressure")
-    elif glucose > 300:
-        triage = "urgent"
-        rationale_parts.append("High glucose level")
-    elif bp_sys > 140 or bp_dia > 90 or glucose > 200:
-        triage = "primary-care"
-        rationale_parts.append("Above target vitals; primary care visit recommended")
-    else:
-        rationale_parts.append("Vitals within acceptable range")
+    for sys_max, dia_max, glucose_max, triage, rationale in _NCD_TIERS:
+        if bp_sys > sys_max or bp_dia > dia_max or glucose > glucose_max:
+            return {"triage": triage, "rationale": rationale}
+    return {"triage": "self-care", "rationale": "Vitals within acceptable range"}
 
-    return {"triage": triage, "rationale": "; ".join(rationale_parts)}
 
-
-def _trend_analysis(observations: List[models.Observation]) -> str:
+def _trend_analysis(observations: Sequence[Row]) -> str:
     """Analyze symptom score trend to provide context."""
 
     if len(observations) < 2:
@@ -177,30 +249,103 @@ def _trend_analysis(observations: List[models.Observation]) -> str:
     return "Symptoms worsening" if worsening else "Symptoms stable or improving"
 
 
+def _get_http_client() -> "httpx.AsyncClient":
+    """Return the shared HTTP client, creating it on first use."""
+
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(  # type: ignore[union-attr]
+            timeout=5.0,
+            limits=httpx.Limits(  # type: ignore[union-attr]
+                max_connections=_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+    return _http_client
+
+
+def open_http_client() -> None:
+    """Create the shared HTTP client up front when an external model is configured."""
+
+    if settings.model_endpoint and httpx is not None:
+        _get_http_client()
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _model_cache_key(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _get_cached_model_result(key: str) -> Optional[Dict[str, Any]]:
+    entry = _model_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if expires_at <= time.monotonic():
+        del _model_cache[key]
+        return None
+    _model_cache.move_to_end(key)
+    return result
+
+
+def _store_model_result(key: str, result: Dict[str, Any]) -> None:
+    _model_cache[key] = (time.monotonic() + _MODEL_CACHE_TTL_SECONDS, result)
+    _model_cache.move_to_end(key)
+    while len(_model_cache) > _MODEL_CACHE_MAX_ENTRIES:
+        _model_cache.popitem(last=False)
+
+
 async def _call_external_model(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Optionally call an external ML model service if configured."""
+    """Optionally call an external ML model service if configured.
+
+    Successful responses are cached for a few minutes so repeated requests for an
+    unchanged episode skip the network round trip.
+    """
 
     if not settings.model_endpoint or httpx is None:
         return None
 
+    # Serialize once: the same canonical bytes key the cache and form the request body.
+    body = orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS)
+    key = _model_cache_key(body)
+    cached = _get_cached_model_result(key)
+    if cached is not None:
+        return cached
+
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:  # type: ignore[attr-defined]
-            response = await client.post(str(settings.model_endpoint), json=payload)
-            response.raise_for_status()
-            return response.json()
+        response = await _get_http_client().post(
+            str(settings.model_endpoint), content=body, headers=_JSON_HEADERS
+        )
+        response.raise_for_status()
+        result = response.json()
     except Exception as exc:  # pragma: no cover - network failures
         logger.warning("External model call failed: %s", exc)
         return None
 
+    if result:
+        _store_model_result(key, result)
+    return result
+
 
 async def predict_recommendation(
     episode: models.Episode,
-    observations: List[models.Observation],
+    observations: Sequence[Row],
 ) -> schemas.RecommendationCreate:
-    """Generate a recommendation using rule-based heuristics or an external model."""
+    """Generate a recommendation using rule-based heuristics or an external model.
+
+    ``observations`` must already be ordered by date, as returned by
+    ``crud.get_observation_rows``.
+    """
 
-    observations_sorted = sorted(observations, key=lambda obs: obs.date)
-    latest_observation = observations_sorted[-1] if observations_sorted else None
+    latest_observation = observations[-1] if observations else None
 
     external_payload = {
         "episode": {
@@ -218,7 +363,7 @@ async def predict_recommendation(
                 "mh_scales": obs.mh_scales,
                 "interventions": obs.interventions,
             }
-            for obs in observations_sorted
+            for obs in observations
         ],
     }
 
@@ -241,7 +386,7 @@ async def predict_recommendation(
             rationale = ncd_result["rationale"]
             condition_hints = ["Chronic condition flare"]
 
-        trend = _trend_analysis(observations_sorted)
+        trend = _trend_analysis(observations)
         interventions = latest_observation.interventions if latest_observation else []
         actions = [
             trend,
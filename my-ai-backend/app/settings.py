@@ -38,9 +38,12 @@ def _require_env(name: str) -> str:
     return value
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Settings:
-    """Simple settings container."""
+    """Simple settings container.
+
+    Instances are immutable and slotted; build a new one instead of mutating.
+    """
 
     app_name: str = os.getenv("APP_NAME", "HealthAI Assistant API")
     api_v1_prefix: str = os.getenv("API_V1_PREFIX", "/api")
@@ -55,8 +58,13 @@ class Settings:
     access_token_expire_minutes: int = _get_int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"), 15)
     refresh_token_expire_minutes: int = _get_int(os.getenv("REFRESH_TOKEN_EXPIRE_MINUTES"), 60 * 24 * 30)
 
+    argon2_time_cost: int = _get_int(os.getenv("ARGON2_TIME_COST"), 3)
+    argon2_memory_cost: int = _get_int(os.getenv("ARGON2_MEMORY_COST"), 65536)
+    argon2_parallelism: int = _get_int(os.getenv("ARGON2_PARALLELISM"), 4)
+
     rate_limit_calls: int = _get_int(os.getenv("RATE_LIMIT_CALLS"), 100)
     rate_limit_period: int = _get_int(os.getenv("RATE_LIMIT_PERIOD"), 60)
+    redis_url: Optional[str] = os.getenv("REDIS_URL") or None
 
     model_endpoint: Optional[str] = os.getenv("MODEL_ENDPOINT") or None
     local_model_path: Optional[str] = os.getenv("LOCAL_MODEL_PATH") or None
@@ -68,9 +76,9 @@ class Settings:
                 import psycopg2  # type: ignore  # noqa: F401
             except ModuleNotFoundError:
                 # Fallback to SQLite when Postgres driver is unavailable (e.g., tests)
-                self.database_url = 'sqlite:///./test.db'
+                object.__setattr__(self, 'database_url', 'sqlite:///./test.db')
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Return cached settings instance."""
 
@@ -25,8 +25,6 @@ async def seed():
                 chronic_conditions=["hypertension"],
             )
             session.add(user)
-            session.commit()
-            session.refresh(user)
 
         episode = Episode(
             id=uuid4(),
@@ -36,10 +34,6 @@ async def seed():
             severity_0_10=7,
             notes="Frequent headaches",
         )
-        session.add(episode)
-        session.commit()
-        session.refresh(episode)
-
         observation = Observation(
             id=uuid4(),
             episode_id=episode.id,
@@ -47,9 +41,6 @@ async def seed():
             symptom_scores={"headache": 6},
             interventions=["amlodipine"],
         )
-        session.add(observation)
-        session.commit()
-
         recommendation = Recommendation(
             id=uuid4(),
             episode_id=episode.id,
@@ -58,7 +49,8 @@ async def seed():
             rationale="Elevated blood pressure readings",
             actions=["Schedule primary care visit", "Review medications"],
         )
-        session.add(recommendation)
+        # Primary keys are generated client-side, so everything goes out in one flush and commit.
+        session.add_all([episode, observation, recommendation])
         session.commit()
         print("Seed data inserted")
     finally:
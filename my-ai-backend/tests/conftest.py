@@ -1,13 +1,15 @@
 """Test configuration and fixtures."""
 from __future__ import annotations
 
+import os
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict
 from uuid import uuid4
 
 import pytest
 from .utils import SimpleASGITestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.dialects.sqlite.base import SQLiteTypeCompiler
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -19,6 +21,11 @@ def _ensure_sqlite_uuid_support() -> None:
 
 _ensure_sqlite_uuid_support()
 
+# Cheap Argon2 parameters keep per-test hashing fast; set before the app reads its settings.
+os.environ.setdefault("ARGON2_TIME_COST", "1")
+os.environ.setdefault("ARGON2_MEMORY_COST", "1024")
+os.environ.setdefault("ARGON2_PARALLELISM", "1")
+
 from app import deps
 from app.db import Base
 from app.main import app
@@ -27,8 +34,22 @@ from app.services import hash_password
 
 TEST_DATABASE_URL = "sqlite:///./test.db"
 
+# Fixture users share a handful of passwords; hash each one once per session.
+_fixture_password_hash = lru_cache(maxsize=None)(hash_password)
+
 engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+
+# pysqlite manages transactions itself and breaks SAVEPOINT; let SQLAlchemy emit BEGIN instead.
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -39,30 +60,45 @@ def setup_database():
 
 
 @pytest.fixture()
-def db_session() -> Session:
-    session = TestingSessionLocal()
+def connection():
+    """Run each test inside an outer transaction that is rolled back afterwards."""
+
+    connection = engine.connect()
+    transaction = connection.begin()
     try:
-        yield session
+        yield connection
     finally:
-        session.close()
+        transaction.rollback()
+        connection.close()
 
 
-def override_get_db():
-    session = TestingSessionLocal()
+@pytest.fixture()
+def db_session(connection) -> Session:
+    # Commits made by the code under test only release a SAVEPOINT on the shared connection.
+    session = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
         session.close()
 
 
-app.dependency_overrides = {}
-app.dependency_overrides[deps.get_db] = override_get_db
-app.dependency_overrides[deps.get_db_session] = override_get_db
+@pytest.fixture(autouse=True)
+def override_get_db(db_session: Session):
+    # A single session keeps nested SAVEPOINTs from interleaving when a request resolves both dependencies.
+    def _get_db():
+        yield db_session
+
+    app.dependency_overrides[deps.get_db] = _get_db
+    app.dependency_overrides[deps.get_db_session] = _get_db
+    yield
+    app.dependency_overrides.clear()
 
 
 @pytest.fixture()
 def client(db_session):
-    return SimpleASGITestClient(app)
+    test_client = SimpleASGITestClient(app)
+    yield test_client
+    test_client.close()
 
 
 @pytest.fixture()
@@ -80,7 +116,7 @@ def create_user(db_session: Session, user_payload: Dict[str, str]):
     user = User(
         id=uuid4(),
         email=user_payload["email"],
-        password_hash=hash_password(user_payload["password"]),
+        password_hash=_fixture_password_hash(user_payload["password"]),
         name=user_payload["name"],
         created_at=datetime.utcnow(),
         updated_at=datetime.utcnow(),
@@ -1,4 +1,15 @@
 """Auth endpoint tests."""
+import hashlib
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app import deps, services
+from app.models import User
+from app.services import create_access_token
+
 from .utils import SimpleASGITestClient as TestClient
 
 
@@ -20,3 +31,96 @@ def test_register_and_login(client: TestClient, user_payload):
     assert refresh_resp.status_code == 200
     refreshed = refresh_resp.json()
     assert refreshed["access_token"] != tokens["access_token"]
+
+
+def test_register_rejects_duplicate_email(client: TestClient, user_payload):
+    first = client.post("/auth/register", json=user_payload)
+    assert first.status_code == 201, first.text
+
+    duplicate = client.post("/auth/register", json=user_payload)
+    assert duplicate.status_code == 400
+    assert duplicate.json()["detail"] == "Email already registered"
+
+
+def test_login_upgrades_legacy_pbkdf2_hash(client: TestClient, db_session, create_user, user_payload):
+    salt = "legacysalt"
+    derived = hashlib.pbkdf2_hmac("sha256", user_payload["password"].encode("utf-8"), salt.encode("utf-8"), 100_000)
+    create_user.password_hash = f"{salt}${derived.hex()}"
+    db_session.commit()
+
+    login_resp = client.post(
+        "/auth/login", json={"email": user_payload["email"], "password": user_payload["password"]}
+    )
+    assert login_resp.status_code == 200, login_resp.text
+
+    db_session.expire_all()
+    upgraded = db_session.get(User, create_user.id)
+    assert upgraded.password_hash.startswith("$argon2id$")
+
+    wrong_resp = client.post("/auth/login", json={"email": user_payload["email"], "password": "wrong-password"})
+    assert wrong_resp.status_code == 401
+
+
+def test_current_user_accepts_id_and_legacy_email_subjects(client: TestClient, create_user, user_payload):
+    for subject in (str(create_user.id), user_payload["email"]):
+        token = create_access_token(subject)
+        me_resp = client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+        assert me_resp.status_code == 200, me_resp.text
+        assert me_resp.json()["email"] == user_payload["email"]
+
+
+def test_tampered_token_signature_is_rejected(client: TestClient, create_user):
+    token = create_access_token(str(create_user.id))
+    header_payload, signature = token.rsplit(".", 1)
+    tampered = f"{header_payload}.{'A' if signature[0] != 'A' else 'B'}{signature[1:]}"
+
+    resp = client.get("/users/me", headers={"Authorization": f"Bearer {tampered}"})
+    assert resp.status_code == 401
+
+
+def _token_with_urlsafe_signature() -> str:
+    """Return a token whose signature contains a url-safe-only character ("-" or "_")."""
+    for nonce in range(1000):
+        token = services._encode_token({"sub": "user", "exp": 4102444800, "type": "access", "n": nonce}, "secret")
+        if set(token.rsplit(".", 1)[1]) & {"-", "_"}:
+            return token
+    raise AssertionError("no signature with url-safe characters found")
+
+
+@pytest.mark.parametrize(
+    "mangled_signature",
+    [
+        lambda sig: sig + "!!",
+        lambda sig: sig + "$",
+        lambda sig: sig[:10] + "\n" + sig[10:],
+        lambda sig: sig.replace("-", "+").replace("_", "/"),
+        lambda sig: sig + "=",
+    ],
+    ids=["junk-suffix", "dollar-suffix", "embedded-newline", "standard-alphabet", "padding"],
+)
+def test_non_canonical_signature_segment_is_rejected(mangled_signature):
+    token = _token_with_urlsafe_signature()
+    assert services._decode_token(token, "secret")["sub"] == "user"
+
+    signing_input, signature = token.rsplit(".", 1)
+    with pytest.raises(ValueError):
+        services._decode_token(f"{signing_input}.{mangled_signature(signature)}", "secret")
+
+
+@pytest.mark.parametrize("tz", ["UTC", "America/New_York", "Asia/Bangkok"])
+def test_expired_access_token_is_rejected_even_when_cached(client: TestClient, create_user, monkeypatch, tz):
+    monkeypatch.setenv("TZ", tz)
+    time.tzset()
+    try:
+        token = create_access_token(str(create_user.id), expires_delta=timedelta(seconds=30))
+        assert client.get("/users/me", headers={"Authorization": f"Bearer {token}"}).status_code == 200
+
+        later = SimpleNamespace(time=lambda: time.time() + 31, monotonic=time.monotonic)
+        monkeypatch.setattr(services, "time", later)
+        monkeypatch.setattr(deps, "time", later)
+
+        resp = client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+        assert resp.status_code == 401
+    finally:
+        monkeypatch.undo()
+        time.tzset()
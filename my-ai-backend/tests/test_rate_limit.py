@@ -0,0 +1,108 @@
+"""Rate limiter middleware tests."""
+import asyncio
+import logging
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+
+from app.main import RateLimiterMiddleware
+
+from .utils import SimpleASGITestClient as TestClient
+
+
+def test_rate_limiter_returns_429_with_retry_after():
+    limited_app = FastAPI()
+    limited_app.add_middleware(RateLimiterMiddleware, calls=2, period=60)
+
+    @limited_app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    client = TestClient(limited_app)
+    assert client.get("/ping").status_code == 200
+    assert client.get("/ping").status_code == 200
+
+    limited = client.get("/ping")
+    assert limited.status_code == 429
+    assert limited.json() == {"detail": "Rate limit exceeded"}
+    assert 1 <= int(limited.headers["retry-after"]) <= 60
+    client.close()
+
+
+class _FakePipeline:
+    def __init__(self, store):
+        self.store = store
+        self.key = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def incr(self, key):
+        self.key = key
+
+    def expire(self, key, seconds):
+        pass
+
+    async def execute(self):
+        self.store[self.key] = self.store.get(self.key, 0) + 1
+        return [self.store[self.key], True]
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self.store)
+
+
+def test_redis_counters_are_shared_between_limiters():
+    shared = _FakeRedis()
+    first = RateLimiterMiddleware(FastAPI(), calls=2, period=86_400)
+    second = RateLimiterMiddleware(FastAPI(), calls=2, period=86_400)
+    first.redis = second.redis = shared
+
+    assert asyncio.run(first._redis_retry_after("10.0.0.1")) is None
+    assert asyncio.run(second._redis_retry_after("10.0.0.1")) is None
+    assert asyncio.run(first._redis_retry_after("10.0.0.1")) is not None
+    assert asyncio.run(second._redis_retry_after("10.0.0.2")) is None
+
+
+class _DownRedis:
+    def __init__(self):
+        self.attempts = 0
+
+    def pipeline(self, transaction=True):
+        self.attempts += 1
+        raise ConnectionError("connection refused")
+
+
+def test_unreachable_redis_falls_back_to_local_limits_and_backs_off(caplog):
+    limiter = RateLimiterMiddleware(FastAPI(), calls=2, period=60)
+    limiter.redis = _DownRedis()
+    request = SimpleNamespace(client=SimpleNamespace(host="10.0.0.1"))
+
+    async def call_next(request):
+        return "ok"
+
+    async def hit():
+        return await limiter.dispatch(request, call_next)
+
+    with caplog.at_level(logging.WARNING, logger="healthai"):
+        assert asyncio.run(hit()) == "ok"
+        assert asyncio.run(hit()) == "ok"
+        assert asyncio.run(hit()).status_code == 429
+
+    assert limiter.redis.attempts == 1
+    assert [r.message for r in caplog.records].count(
+        "Redis rate limiter unavailable, using local limits: connection refused"
+    ) == 1
+
+    limiter._redis_retry_at = 0.0
+    limiter.redis = _FakeRedis()
+    limiter.buckets.clear()
+    assert asyncio.run(hit()) == "ok"
+    assert limiter._redis_retry_at is None
@@ -1,5 +1,12 @@
 """Recommendation service tests."""
+import asyncio
+import dataclasses
 from datetime import datetime
+from types import SimpleNamespace
+
+import orjson
+
+from app import services
 
 from .utils import SimpleASGITestClient as TestClient
 
@@ -37,3 +44,59 @@ def test_generate_recommendation_for_mh(client: TestClient, user_payload):
     rec_data = rec_resp.json()
     assert rec_data["triage_level"] in {"urgent", "emergency"}
     assert "rationale" in rec_data
+
+    fetch_resp = client.get(f"/recommendations/{rec_data['id']}", headers=headers)
+    assert fetch_resp.status_code == 200, fetch_resp.text
+    assert fetch_resp.json()["episode_id"] == episode_id
+
+
+def test_external_model_responses_are_cached(monkeypatch):
+    calls = []
+
+    class FakeResponse:
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return {"triage_level": "urgent"}
+
+    class FakeClient:
+        async def post(self, url, content, headers):
+            assert headers["Content-Type"] == "application/json"
+            calls.append(orjson.loads(content))
+            return FakeResponse()
+
+    monkeypatch.setattr(
+        services, "settings", dataclasses.replace(services.settings, model_endpoint="http://model.invalid/predict")
+    )
+    monkeypatch.setattr(services, "_get_http_client", lambda: FakeClient())
+    monkeypatch.setattr(services, "_model_cache", services.OrderedDict())
+
+    payload = {"episode": {"id": "abc", "domain": "NCD"}, "observations": []}
+    first = asyncio.run(services._call_external_model(payload))
+    second = asyncio.run(services._call_external_model(dict(payload)))
+    asyncio.run(services._call_external_model({**payload, "observations": [{"id": "x"}]}))
+
+    assert first == second == {"triage_level": "urgent"}
+    assert len(calls) == 2
+
+
+def _mh_triage(**scales):
+    return services._mh_rules(SimpleNamespace(mh_scales=scales))["triage"]
+
+
+def _ncd_triage(**vitals):
+    return services._ncd_rules(SimpleNamespace(vitals=vitals))["triage"]
+
+
+def test_rule_tiers_pick_first_matching_threshold():
+    assert _mh_triage(phq9=9, gad7=9) == "self-care"
+    assert _mh_triage(phq9=10) == "primary-care"
+    assert _mh_triage(gad7=13) == "urgent"
+    assert _mh_triage(phq9=20, gad7=0) == "emergency"
+
+    assert _ncd_triage(bp_sys=140, bp_dia=90, glucose=200) == "self-care"
+    assert _ncd_triage(glucose=201) == "primary-care"
+    assert _ncd_triage(glucose=301, bp_sys=150) == "urgent"
+    assert _ncd_triage(bp_dia=121) == "emergency"
+    assert services._ncd_rules(None)["triage"] == "self-care"
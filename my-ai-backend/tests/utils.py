@@ -2,10 +2,10 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
+import orjson
 from fastapi import FastAPI
 from starlette.datastructures import Headers
 
@@ -17,7 +17,7 @@ class SimpleResponse:
     headers: Headers
 
     def json(self) -> Any:
-        return json.loads(self.body.decode() or "null")
+        return orjson.loads(self.body) if self.body else None
 
     @property
     def text(self) -> str:
@@ -31,6 +31,7 @@ class SimpleASGITestClient:
 
     def __init__(self, app: FastAPI):
         self.app = app
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     def request(
         self,
@@ -42,9 +43,21 @@ class SimpleASGITestClient:
         headers = headers or {}
         body = b""
         if json_data is not None:
-            body = json.dumps(json_data).encode("utf-8")
-            if "content-type" not in {k.lower() for k in headers}:
+            body = orjson.dumps(json_data)
+            if not any(k.lower() == "content-type" for k in headers):
                 headers = {**headers, "Content-Type": "application/json"}
+        scope = {
+            "type": "http",
+            "http_version": "1.1",
+            "method": method.upper(),
+            "path": url,
+            "raw_path": url.encode(),
+            "query_string": b"",
+            "headers": [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+            "scheme": "http",
+        }
 
         async def _send_request():
             response_data: Dict[str, Any] = {}
@@ -61,19 +74,6 @@ class SimpleASGITestClient:
                     response_data.setdefault("body", b"")
                     response_data["body"] += message.get("body", b"")
 
-            scope = {
-                "type": "http",
-                "http_version": "1.1",
-                "method": method.upper(),
-                "path": url,
-                "raw_path": url.encode(),
-                "query_string": b"",
-                "headers": [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()],
-                "client": ("testclient", 50000),
-                "server": ("testserver", 80),
-                "scheme": "http",
-            }
-
             await self.app(scope, receive, send)
             return SimpleResponse(
                 status_code=response_data.get("status", 500),
@@ -81,7 +81,10 @@ class SimpleASGITestClient:
                 headers=response_data.get("headers", Headers()),
             )
 
-        return asyncio.run(_send_request())
+        # Reuse one event loop per client instead of building a new one for every request.
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(_send_request())
 
     def get(self, url: str, headers: Optional[Dict[str, str]] = None):
         return self.request("GET", url, headers=headers)
@@ -90,4 +93,7 @@ class SimpleASGITestClient:
         return self.request("POST", url, json_data=json, headers=headers)
 
     def close(self):
-        pass
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
+        self._loop = None